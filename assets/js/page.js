@@ -0,0 +1,56 @@
+const buttons = Array.from(document.querySelectorAll('.sec-btn'));
+const panels = Array.from(document.querySelectorAll('.sec-panel'));
+
+function closeAll() {
+  panels.forEach(panel => {
+    panel.classList.remove('is-active');
+    panel.setAttribute('aria-hidden', 'true');
+  });
+  buttons.forEach(button => {
+    button.classList.remove('is-active');
+    button.setAttribute('aria-expanded', 'false');
+  });
+}
+
+function openById(targetId) {
+  const panel = document.getElementById(targetId);
+  if (!panel) return;
+  closeAll();
+  panel.classList.add('is-active');
+  panel.setAttribute('aria-hidden', 'false');
+  const button = buttons.find(btn => btn.dataset.target === targetId);
+  if (button) {
+    button.classList.add('is-active');
+    button.setAttribute('aria-expanded', 'true');
+  }
+  panel.scrollIntoView({ behavior: 'smooth', block: 'start' });
+}
+
+buttons.forEach(button => {
+  button.addEventListener('click', () => {
+    const targetId = button.dataset.target;
+    const panel = document.getElementById(targetId);
+    const willOpen = !panel.classList.contains('is-active');
+    closeAll();
+    if (willOpen) {
+      panel.classList.add('is-active');
+      panel.setAttribute('aria-hidden', 'false');
+      button.classList.add('is-active');
+      button.setAttribute('aria-expanded', 'true');
+    }
+  });
+});
+
+document.querySelectorAll('[data-open]').forEach(link => {
+  link.addEventListener('click', event => {
+    const targetId = link.getAttribute('data-open');
+    if (targetId) {
+      event.preventDefault();
+      openById(targetId);
+    }
+  });
+});
+
+window.addEventListener('load', () => {
+  document.body.classList.add('is-ready');
+});